@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
@@ -16,86 +17,13 @@ px.defaults.template = "plotly_dark"
 # --------------------------------------------------
 # CUSTOM FONT + GLOBAL STYLING
 # --------------------------------------------------
-st.markdown("""
-<style>
-
-@import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@400;600;800&family=Press+Start+2P&display=swap');
-
-html, body, [class*="css"]  {
-    font-family: 'Montserrat', sans-serif;
-}
-
-/* Background */
-.stApp {
-    background-color: #0D0D12;
-    color: #EAEAF0;
-}
-
-/* Sidebar */
-[data-testid="stSidebar"] {
-    background-color: #15151F;
-}
-
-/* Gradient Hero Title */
-.hero-title {
-    text-align: center;
-    font-size: 44px;
-    font-weight: 800;
-    background: linear-gradient(90deg, #6A0DAD, #B026FF);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    margin-bottom: 5px;
-}
-
-/* Subtitle */
-.hero-sub {
-    text-align: center;
-    color: #BBBBCC;
-    margin-bottom: 30px;
-}
-
-/* Section Card */
-.section-card {
-    background: #15151F;
-    border-radius: 14px;
-    padding: 15px;
-    margin: 12px 0;
-}
-
-/* Metric Cards */
-[data-testid="stMetric"] {
-    background-color: #1A1A26;
-    padding: 12px;
-    border-radius: 14px;
-    box-shadow: 0px 4px 20px rgba(176,38,255,0.4);
-}
-
-/* Buttons */
-.stButton>button {
-    background: linear-gradient(90deg, #6A0DAD, #B026FF);
-    color: white;
-    font-weight: 600;
-    border-radius: 10px;
-    border: none;
-}
-
-.stButton>button:hover {
-    background: linear-gradient(90deg, #8E2DE2, #B026FF);
-    transform: scale(1.02);
-}
-
-/* DataFrame */
-[data-testid="stDataFrame"] {
-    border-radius: 12px;
-}
-
-/* Sliders */
-[data-baseweb="slider"] [role="slider"] {
-    background-color: #B026FF !important;
-}
+@st.cache_data
+def load_css():
+    with open("style.css") as f:
+        return f.read()
 
-</style>
-""", unsafe_allow_html=True)
+# All app CSS lives in style.css and is injected in one block
+st.markdown(f"<style>\n{load_css()}\n</style>", unsafe_allow_html=True)
 
 # --------------------------------------------------
 # HERO SECTION
@@ -106,9 +34,62 @@ st.markdown('<div class="hero-sub">Advanced Combine Performance & Pipeline Intel
 # --------------------------------------------------
 # LOAD DATA
 # --------------------------------------------------
-@st.cache_data
+# --- Manual school → state mapping ---
+# Add more schools as needed
+school_state_map = {
+    "Alabama": "AL",
+    "Auburn": "AL",
+    "Notre Dame": "IN",
+    "LSU": "LA",
+    "Ohio State": "OH",
+    "Michigan": "MI",
+    "Florida": "FL",
+    "Florida State": "FL",
+    "Georgia": "GA",
+    "Texas": "TX",
+    "Texas A&M": "TX",
+    "Oklahoma": "OK",
+    "USC": "CA",
+    "UCLA": "CA",
+    "Clemson": "SC",
+    "Penn State": "PA",
+    "Tennessee": "TN",
+    "Oregon": "OR",
+    "Washington": "WA",
+    "Wisconsin": "WI",
+    "Iowa": "IA",
+    "North Carolina": "NC",
+    "NC State": "NC",
+    "South Carolina": "SC",
+    "Arkansas": "AR",
+    "Mississippi State": "MS",
+    "Ole Miss": "MS",
+    "Kentucky": "KY",
+    "Miami (FL)": "FL",
+}
+
+# Explicit dtypes for the combine columns we use (raw CSV headers).
+# Measurements have at most 2 decimals, so float32 is plenty.
+COMBINE_DTYPES = {
+    "Year": "int16",
+    "Player": "object",
+    "Pos": "category",
+    "School": "category",
+    "Weight": "float32",
+    "40yd": "float32",
+    "Vertical": "float32",
+    "Bench": "float32",
+    "Broad Jump": "float32",
+    "3Cone": "float32",
+    "Shuttle": "float32",
+}
+
 def load_data():
-    df = pd.read_csv("nfl_combine_2010_to_2023.csv")
+    df = pd.read_csv(
+        "nfl_combine_2010_to_2023.csv",
+        usecols=list(COMBINE_DTYPES),
+        dtype=COMBINE_DTYPES
+    )
 
     # Clean column names
     df.columns = df.columns.str.strip().str.lower()
@@ -123,25 +104,48 @@ def load_data():
 
     return df
 
-@st.cache_data
 def load_player_info():
-    players = pd.read_csv("players.csv")
+    players = pd.read_csv(
+        "players.csv",
+        usecols=["display_name", "headshot"],
+        dtype="object"
+    )
     players.columns = players.columns.str.strip().str.lower()
     return players
 
-df = load_data()
-players_df = load_player_info()
+# Shared read-only frame: cache_resource skips the pickle copy
+# cache_data makes on every hit. Filters below only ever slice it.
+@st.cache_resource
+def prepare_df():
+    df = load_data()
+    players_df = load_player_info()
+
+    # Clean names for merge
+    df["player_clean"] = df["player"].str.strip().str.lower()
+    players_df["player_clean"] = players_df["display_name"].str.strip().str.lower()
+
+    # Merge headshot column (the join key isn't needed afterwards)
+    df = df.merge(
+        players_df[["player_clean", "headshot"]],
+        on="player_clean",
+        how="left"
+    ).drop(columns="player_clean")
+
+    # Create state column (unmapped schools stay NaN).
+    # Map the ~300 school categories once, then broadcast by code.
+    school_codes = df["school"].cat.codes.to_numpy()
+    state_lookup = np.asarray(
+        df["school"].cat.categories.map(school_state_map),
+        dtype=object
+    )
+    df["state"] = np.where(school_codes >= 0, state_lookup[school_codes], np.nan)
 
-# Clean names for merge
-df["player_clean"] = df["player"].str.strip().str.lower()
-players_df["player_clean"] = players_df["display_name"].str.strip().str.lower()
+    # Keep rows ordered by year so year ranges are contiguous slices
+    df = df.sort_values("year", kind="stable").reset_index(drop=True)
 
-# Merge headshot column
-df = df.merge(
-    players_df[["player_clean", "headshot"]],
-    on="player_clean",
-    how="left"
-)
+    return df
+
+df = prepare_df()
 
 # --------------------------------------------------
 # GLOBAL DISPLAY LABELS (Use Everywhere)
@@ -159,14 +163,6 @@ DISPLAY_LABELS = {
     "school": "School"
 }
 
-# Ensure numeric columns are numeric
-numeric_cols = ["year", "weight", "forty", "vertical",
-                "bench", "broad_jump", "threecone", "shuttle"]
-
-for col in numeric_cols:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
 # --------------------------------------------------
 # SIDEBAR FILTERS
 # --------------------------------------------------
@@ -189,13 +185,40 @@ selected_position = st.sidebar.selectbox(
 )
 
 # Apply filters
-filtered_df = df[
-    (df["year"] >= year_range[0]) &
-    (df["year"] <= year_range[1])
-]
+def apply_filters(year_lo, year_hi, pos):
+    # df is sorted by year, so binary search the range bounds and slice
+    i0, i1 = np.searchsorted(df["year"].to_numpy(), [year_lo, year_hi + 1])
+    sub = df.iloc[i0:i1]
 
-if selected_position != "All":
-    filtered_df = filtered_df[filtered_df["position"] == selected_position]
+    if pos != "All":
+        sub = sub[sub["position"] == pos]
+
+    return sub
+
+filtered_df = apply_filters(year_range[0], year_range[1], selected_position)
+
+# Filter -> aggregate results, memoized on the widget values
+@st.cache_data
+def kpi_counts_for(year_lo, year_hi, pos):
+    sub = apply_filters(year_lo, year_hi, pos)
+
+    # Count distinct categories from the integer codes, not the strings
+    n_schools = sub["school"].cat.remove_unused_categories().cat.categories.size
+    n_positions = sub["position"].cat.remove_unused_categories().cat.categories.size
+
+    return len(sub), n_schools, n_positions
+
+# Not cached itself: only called from the cached build_state_map
+def state_counts_for(year_lo, year_hi, pos):
+    sub = apply_filters(year_lo, year_hi, pos)
+
+    # Drop schools not mapped, then count players per state
+    return (
+        sub.dropna(subset=["state"])
+        .groupby("state")
+        .size()
+        .reset_index(name="player_count")
+    )
 
 event_options = {
     f"{DISPLAY_LABELS['forty']} (Fastest)": ("forty", True),
@@ -217,68 +240,22 @@ st.markdown('<div class="section-card">', unsafe_allow_html=True)
 
 k1, k2, k3, k4 = st.columns(4)
 
-k1.metric("Total Players", len(filtered_df))
-k2.metric("Unique Schools", filtered_df["school"].nunique())
-k3.metric("Positions", filtered_df["position"].nunique())
+n_players, n_schools, n_positions = kpi_counts_for(
+    year_range[0], year_range[1], selected_position
+)
+
+k1.metric("Total Players", n_players)
+k2.metric("Unique Schools", n_schools)
+k3.metric("Positions", n_positions)
 k4.metric("Years Selected", f"{year_range[0]}–{year_range[1]}")
 
 st.markdown('</div>', unsafe_allow_html=True)
 
-col_left, col_right = st.columns([1.1, 1])
-
-with col_left:
-    # --------------------------------------------------
-    # 1. TRUE U.S. STATE MAP
-    # --------------------------------------------------
-    st.markdown('<div class="section-card">', unsafe_allow_html=True)
-    st.header("College Production Map")
-
-    # --- Manual school → state mapping ---
-    # Add more schools as needed
-    school_state_map = {
-        "Alabama": "AL",
-        "Auburn": "AL",
-        "Notre Dame": "IN",
-        "LSU": "LA",
-        "Ohio State": "OH",
-        "Michigan": "MI",
-        "Florida": "FL",
-        "Florida State": "FL",
-        "Georgia": "GA",
-        "Texas": "TX",
-        "Texas A&M": "TX",
-        "Oklahoma": "OK",
-        "USC": "CA",
-        "UCLA": "CA",
-        "Clemson": "SC",
-        "Penn State": "PA",
-        "Tennessee": "TN",
-        "Oregon": "OR",
-        "Washington": "WA",
-        "Wisconsin": "WI",
-        "Iowa": "IA",
-        "North Carolina": "NC",
-        "NC State": "NC",
-        "South Carolina": "SC",
-        "Arkansas": "AR",
-        "Mississippi State": "MS",
-        "Ole Miss": "MS",
-        "Kentucky": "KY",
-        "Miami (FL)": "FL",
-    }
-
-    # Create state column
-    filtered_df["state"] = filtered_df["school"].map(school_state_map)
-
-    # Drop schools not mapped
-    state_df = filtered_df.dropna(subset=["state"])
-
-    # Count players per state
-    state_counts = (
-        state_df.groupby("state")
-        .size()
-        .reset_index(name="player_count")
-    )
+# Figures are memoized on the filter values and metric so
+# unchanged reruns skip Plotly figure construction
+@st.cache_data
+def build_state_map(year_lo, year_hi, pos):
+    state_counts = state_counts_for(year_lo, year_hi, pos)
 
     fig_state_map = px.choropleth(
         state_counts,
@@ -296,6 +273,91 @@ with col_left:
         font_color="#EAEAF0"
     )
 
+    return fig_state_map
+
+@st.cache_data
+def build_pipeline_fig(year_lo, year_hi, pos, metric, ascending_sort):
+    # Only players with a result for the selected metric
+    pipeline_df = apply_filters(year_lo, year_hi, pos).dropna(subset=[metric])
+
+    # Keep top 8 schools by player count
+    school_counts = pipeline_df["school"].value_counts()
+    top_schools = school_counts[school_counts > 0].nlargest(8).index
+
+    pipeline_df = (
+        pipeline_df[pipeline_df["school"].isin(top_schools)]
+        .astype({metric: "float64"})
+        .round({metric: 2})
+    )
+
+    # Determine sorting direction automatically
+    # ascending_sort = True means lower is better (e.g., 40 time)
+    # Only 8 groups, so plain NumPy medians beat groupby overhead
+    schools = list(top_schools)
+    school_vals = pipeline_df["school"].to_numpy()
+    metric_vals = pipeline_df[metric].to_numpy()
+    medians = [np.median(metric_vals[school_vals == s]) for s in schools]
+
+    order = np.argsort(medians, kind="stable")
+    if not ascending_sort:
+        order = order[::-1]
+    median_order = [schools[i] for i in order]
+
+    # Drawing every sample as an SVG marker bogs down the
+    # browser for large groups, so fall back to outliers only
+    box_points = "all" if len(pipeline_df) <= 500 else "outliers"
+
+    fig = px.box(
+        pipeline_df,
+        x="school",
+        y=metric,
+        points=box_points,
+        category_orders={"school": median_order},
+        title=f"{DISPLAY_LABELS[metric]} Distribution by School ({pos})",
+        labels={
+            "school": "School",
+            metric: DISPLAY_LABELS[metric]
+        },
+        color_discrete_sequence=["#B026FF"]
+    )
+
+    fig.update_traces(
+        marker=dict(
+            size=6,
+            color="#B026FF",
+            opacity=0.7
+        ),
+        line=dict(width=2)
+    )
+
+    fig.update_layout(
+        xaxis_tickangle=-45,
+        transition_duration=500,
+        paper_bgcolor="#0D0D12",
+        plot_bgcolor="#15151F",
+        font_color="#EAEAF0",
+        hoverlabel=dict(
+            bgcolor="black",
+            font_size=14,
+            font_family="Arial"
+        )
+    )
+
+    return fig
+
+col_left, col_right = st.columns([1.1, 1])
+
+with col_left:
+    # --------------------------------------------------
+    # 1. TRUE U.S. STATE MAP
+    # --------------------------------------------------
+    st.markdown('<div class="section-card">', unsafe_allow_html=True)
+    st.header("College Production Map")
+
+    fig_state_map = build_state_map(
+        year_range[0], year_range[1], selected_position
+    )
+
     st.plotly_chart(fig_state_map, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
@@ -318,81 +380,9 @@ with col_right:
         </div>
         """, unsafe_allow_html=True)
     else:
-        # Use the currently selected metric from Top Performers
-        pipeline_df = filtered_df.dropna(subset=[metric])
-
-        # Keep top 8 schools by player count
-        top_schools = (
-            pipeline_df.groupby("school")
-            .size()
-            .reset_index(name="count")
-            .sort_values("count", ascending=False)
-            .head(8)["school"]
-        )
-
-        pipeline_df = pipeline_df[pipeline_df["school"].isin(top_schools)]
-
-        # Determine sorting direction automatically
-        # ascending_sort = True means lower is better (e.g., 40 time)
-        if ascending_sort:
-            median_order = (
-                pipeline_df.groupby("school")[metric]
-                .median()
-                .sort_values(ascending=True)
-                .index
-                .tolist()
-            )
-        else:
-            median_order = (
-                pipeline_df.groupby("school")[metric]
-                .median()
-                .sort_values(ascending=False)
-                .index
-                .tolist()
-            )
-
-        fig = px.box(
-            pipeline_df,
-            x="school",
-            y=metric,
-            points="all",
-            category_orders={"school": median_order},
-            title=f"{DISPLAY_LABELS[metric]} Distribution by School ({selected_position})",
-            labels={
-                "school": "School",
-                metric: DISPLAY_LABELS[metric]
-            },
-            color_discrete_sequence=["#B026FF"]
-        )
-
-        fig.update_traces(
-            marker=dict(
-                size=6,
-                color="#B026FF",
-                opacity=0.7
-            ),
-            line=dict(width=2)
-        )
-
-        fig.update_layout(
-            xaxis_tickangle=-45,
-            transition_duration=500,
-            paper_bgcolor="#0D0D12",
-            plot_bgcolor="#15151F",
-            font_color="#EAEAF0",
-            hoverlabel=dict(
-                bgcolor="#1A1A26",
-                font_size=14,
-                font_family="Arial"
-            )
-        )
-        fig.update_layout(transition_duration=500)
-        fig.update_layout(
-            hoverlabel=dict(
-                bgcolor="black",
-                font_size=14,
-                font_family="Arial"
-            )
+        fig = build_pipeline_fig(
+            year_range[0], year_range[1], selected_position,
+            metric, ascending_sort
         )
 
         st.plotly_chart(fig, use_container_width=True)
@@ -409,12 +399,20 @@ performance_df = filtered_df.dropna(subset=[metric])
 
 top_n = st.slider("Number of Top Performers", 5, 50, 10)
 
-top_performers = (
-    performance_df
-    .sort_values(metric, ascending=ascending_sort)
-    .head(top_n)
-    [["player", "position", "school", "year", metric]]
-)
+performer_cols = ["player", "position", "school", "year", metric]
+
+def top_by_metric(frame, n):
+    # Bounded heap selection instead of a full sort
+    frame = frame[performer_cols]
+    if ascending_sort:
+        top = frame.nsmallest(n, metric)
+    else:
+        top = frame.nlargest(n, metric)
+
+    # Widen back from float32 so tables show e.g. 4.6, not 4.599999904
+    return top.astype({metric: "float64"}).round({metric: 2})
+
+top_performers = top_by_metric(performance_df, top_n)
 
 top_performers = top_performers.rename(columns=DISPLAY_LABELS)
 
@@ -431,12 +429,7 @@ all_time_df = df.dropna(subset=[metric])
 if selected_position != "All":
     all_time_df = all_time_df[all_time_df["position"] == selected_position]
 
-all_time_top = (
-    all_time_df
-    .sort_values(metric, ascending=ascending_sort)
-    .head(top_n)
-    [["player", "position", "school", "year", metric]]
-)
+all_time_top = top_by_metric(all_time_df, top_n)
 
 # Rename columns using global label dictionary
 all_time_top = all_time_top.rename(columns=DISPLAY_LABELS)
@@ -454,17 +447,43 @@ def ordinal(n):
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
     return f"{n}{suffix}"
 
+# Percentiles are whole numbers in 0–100, so precompute their labels
+ORDINALS = [ordinal(i) for i in range(101)]
+
 st.markdown('<div class="section-card">', unsafe_allow_html=True)
 st.header("Player Comparison Tool")
 
-comparison_df = df.copy()
-
 compare_metrics = ["forty", "vertical", "bench",
                    "broad_jump", "threecone", "shuttle"]
 
-comparison_df = comparison_df.dropna(subset=compare_metrics)
+@st.cache_resource
+def prepare_comparison_df():
+    comparison_df = df.dropna(subset=compare_metrics)
+    # One row per name (first match), indexed for O(1) lookups.
+    # Only used for the selectboxes and the selected players' rows.
+    return (
+        comparison_df
+        .drop_duplicates("player")
+        .set_index("player", drop=False)
+    )
+
+comparison_df = prepare_comparison_df()
+
+# Sorted metric arrays for every position, built once up front.
+# The population is every row with all comparison metrics (no dedupe).
+@st.cache_resource
+def percentile_tables():
+    population = df.dropna(subset=compare_metrics)
+    return {
+        pos: {m: np.sort(grp[m].to_numpy()) for m in compare_metrics}
+        for pos, grp in population.groupby("position", observed=True)
+    }
+
+@st.cache_data
+def get_player_list():
+    return sorted(comparison_df["player"].unique().tolist())
 
-players = sorted(comparison_df["player"].unique())
+players = get_player_list()
 
 col1, col2 = st.columns(2)
 
@@ -479,8 +498,8 @@ if player1 and player2:
     # --------------------------------------------------
     # Get Selected Player Rows FIRST
     # --------------------------------------------------
-    p1_data = comparison_df[comparison_df["player"] == player1].iloc[0]
-    p2_data = comparison_df[comparison_df["player"] == player2].iloc[0]
+    p1_data = comparison_df.loc[player1]
+    p2_data = comparison_df.loc[player2]
 
     # --------------------------------------------------
     # PLAYER IMAGES (VISUAL UPGRADE)
@@ -531,22 +550,21 @@ if player1 and player2:
     st.subheader("Athletic Percentile Comparison")
 
     # Compute percentiles within position group
-    position_df = comparison_df[
-        comparison_df["position"] == p1_data["position"]
-    ]
+    # (share of position peers strictly below each player's value)
+    sorted_metrics = percentile_tables()[p1_data["position"]]
 
     p1_percentiles = {}
     p2_percentiles = {}
 
     for metric_name in compare_metrics:
-        values = position_df[metric_name]
-        
+        sorted_vals = sorted_metrics[metric_name]
+
         p1_val = p1_data[metric_name]
         p2_val = p2_data[metric_name]
-        
-        p1_pct = (values < p1_val).mean() * 100
-        p2_pct = (values < p2_val).mean() * 100
-        
+
+        p1_pct = np.searchsorted(sorted_vals, p1_val, side="left") / len(sorted_vals) * 100
+        p2_pct = np.searchsorted(sorted_vals, p2_val, side="left") / len(sorted_vals) * 100
+
         p1_percentiles[metric_name] = p1_pct
         p2_percentiles[metric_name] = p2_pct
 
@@ -556,72 +574,33 @@ if player1 and player2:
         p1_percentiles[metric_name] = 100 - p1_percentiles[metric_name]
         p2_percentiles[metric_name] = 100 - p2_percentiles[metric_name]
 
-    # Inject animation CSS
-    st.markdown("""
-    <style>
-    .metric-container {
-        margin-bottom: 6px;
-    }
-    .metric-label {
-        font-size: 14px;
-        font-weight: 600;
-        margin-bottom: 4px;
-    }
-    .bar-background {
-        background-color: #1A1A26;
-        border-radius: 6px;
-        height: 10px;
-        overflow: hidden;
-    }
-    .bar-fill {
-        height: 100%;
-        background: linear-gradient(90deg, #6A0DAD, #B026FF);
-        width: 0%;
-        transition: width 0.6s ease-in-out;
-    }
-    .bar-value {
-        font-size: 12px;
-        margin-top: 2px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Render animated bars (one markdown call for all metrics)
+    def percentile_bar(label, pct):
+        return (
+            "<div class='metric-col'>"
+            f"<div class='metric-label'>{label}</div>"
+            "<div class='bar-background'>"
+            f"<div class='bar-fill' style='width:{pct}%;'></div>"
+            "</div>"
+            f"<div class='bar-value'>{ORDINALS[pct]} percentile</div>"
+            "</div>"
+        )
 
-    # Render animated bars
+    html_parts = []
     for metric_name in compare_metrics:
 
         label = DISPLAY_LABELS[metric_name]
         p1_val = int(round(p1_percentiles[metric_name]))
         p2_val = int(round(p2_percentiles[metric_name]))
 
-        st.markdown(f"<div class='metric-container'>", unsafe_allow_html=True)
-
-        colA, colB = st.columns(2)
-
-        with colA:
-            st.markdown(
-                f"<div class='metric-label'>{label}</div>",
-                unsafe_allow_html=True
-            )
-            st.markdown(f"""
-            <div class='bar-background'>
-                <div class='bar-fill' style='width:{p1_val}%;'></div>
-            </div>
-            <div class='bar-value'>{ordinal(p1_val)} percentile</div>
-            """, unsafe_allow_html=True)
-
-        with colB:
-            st.markdown(
-                f"<div class='metric-label'>{label}</div>",
-                unsafe_allow_html=True
-            )
-            st.markdown(f"""
-            <div class='bar-background'>
-                <div class='bar-fill' style='width:{p2_val}%;'></div>
-            </div>
-            <div class='bar-value'>{ordinal(p2_val)} percentile</div>
-            """, unsafe_allow_html=True)
+        html_parts.append(
+            "<div class='metric-container metric-row'>"
+            + percentile_bar(label, p1_val)
+            + percentile_bar(label, p2_val)
+            + "</div>"
+        )
 
-        st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown("\n".join(html_parts), unsafe_allow_html=True)
 
 # End of Player Comparison section
 
@@ -629,22 +608,6 @@ if player1 and player2:
 # Floating Watermark Signature
 # ----------------------------------
 st.markdown("""
-<style>
-.signature-watermark {
-    position: fixed;
-    bottom: 12px;
-    right: 20px;
-    color: #B026FF;
-    opacity: 0.50;
-    text-shadow:
-        0 0 4px #B026FF,
-        0 0 8px rgba(176,38,255,0.5);
-    font-size: 8px;
-    font-family: 'Press Start 2P', cursive;
-    letter-spacing: 0.5px;
-}
-</style>
-
 <div class="signature-watermark">
 Developed by Sathvik Medapati
 </div>